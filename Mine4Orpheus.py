@@ -1,7 +1,16 @@
 import pygame
-import random
+import numpy as np
 import sys
 import math
+from functools import lru_cache
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # --- CONFIGURATION & CONSTANTS ---
 WIDTH, HEIGHT = 640, 480
@@ -9,6 +18,7 @@ TILE_SIZE = 32
 FPS = 60
 COLS, ROWS = WIDTH // TILE_SIZE, HEIGHT // TILE_SIZE
 UI_PANEL_HEIGHT = 60
+PYGAME_CE = getattr(pygame, 'IS_CE', False)
 
 # Tile IDs
 EMPTY, DIRT, ROCK, BRONZE, SILVER, GOLD, DIAMOND = 0, 1, 2, 3, 4, 5, 6
@@ -19,11 +29,31 @@ TILE_COLORS = {
 }
 GLOW_BASE_COLORS = {BRONZE: (205, 127, 50), SILVER: (192, 192, 192), GOLD: (255, 215, 0), DIAMOND: (0, 255, 255)}
 DURABILITY = {DIRT: 1, ROCK: 9999, BRONZE: 3, SILVER: 5, GOLD: 8, DIAMOND: 12}
+
+# Tuple lookups indexed by tile ID; GLOW_BASE_COLORS_ARR holds None for tiles that don't glow
+TILE_COLORS_ARR = tuple(TILE_COLORS[tile_id] for tile_id in range(EMPTY, DIAMOND + 1))
+GLOW_BASE_COLORS_ARR = tuple(GLOW_BASE_COLORS.get(tile_id) for tile_id in range(EMPTY, DIAMOND + 1))
+DURABILITY_ARR = tuple(DURABILITY.get(tile_id, 1) for tile_id in range(EMPTY, DIAMOND + 1))
+DURABILITY_LUT = np.array(DURABILITY_ARR, dtype=np.uint16)
+TERRAIN_CHOICES = np.array([DIRT, ROCK, BRONZE, SILVER, GOLD, DIAMOND], dtype=np.uint8)
 ORE_CONFIG = {
     'ROCK': {'base': 10, 'scale': 0.05}, 'BRONZE': {'base': 15, 'scale': -0.1},
     'SILVER': {'base': 8, 'scale': -0.05}, 'GOLD': {'base': 3, 'scale': 0.15},
     'DIAMOND': {'base': 1, 'scale': 0.1}
 }
+_ROCK_B, _ROCK_S = ORE_CONFIG['ROCK']['base'], ORE_CONFIG['ROCK']['scale']
+_BRONZE_B, _BRONZE_S = ORE_CONFIG['BRONZE']['base'], ORE_CONFIG['BRONZE']['scale']
+_SILVER_B, _SILVER_S = ORE_CONFIG['SILVER']['base'], ORE_CONFIG['SILVER']['scale']
+_GOLD_B, _GOLD_S = ORE_CONFIG['GOLD']['base'], ORE_CONFIG['GOLD']['scale']
+_DIAMOND_B, _DIAMOND_S = ORE_CONFIG['DIAMOND']['base'], ORE_CONFIG['DIAMOND']['scale']
+
+# Movement keys in priority order: (key, dx, dy, facing_right or None to keep facing)
+MOVE_KEYS = (
+    (pygame.K_LEFT, -1, 0, False), (pygame.K_a, -1, 0, False),
+    (pygame.K_RIGHT, 1, 0, True), (pygame.K_d, 1, 0, True),
+    (pygame.K_DOWN, 0, 1, None), (pygame.K_s, 0, 1, None),
+    (pygame.K_UP, 0, -1, None), (pygame.K_w, 0, -1, None),
+)
 
 # Overworld Constants
 C_FLOOR = (45, 40, 35)
@@ -31,6 +61,10 @@ C_WALL = (80, 70, 60)
 C_COUNTER = (120, 80, 40)
 C_ORPHEUS = (150, 50, 200)
 
+OW_FLOOR, OW_WALL, OW_COUNTER, OW_ORPHEUS, OW_HOLE = 0, 1, 2, 3, 4
+OW_TILE_CODES = {'.': OW_FLOOR, 'S': OW_FLOOR, 't': OW_FLOOR, 'W': OW_WALL, 'C': OW_COUNTER, 'O': OW_ORPHEUS,
+                 'H': OW_HOLE}
+
 # H = Hole, S = Spawn, O = Orpheus, C = Counter, W = Wall, t = Torch, . = Floor
 LEVEL_MAP = [
     "WWWWWWWWWWWWWWWWWWWW",
@@ -80,16 +114,25 @@ class GameSession:
 class Button:
     def __init__(self, x, y, width, height, text, font):
         self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
         self.font = font
+        self.text = text
         self.color = (80, 80, 100)
         self.hover_color = (110, 110, 130)
 
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+        self._text_surf = self.font.render(value, False, (255, 255, 255))
+
     def draw(self, surface, mouse_pos):
         color = self.hover_color if self.rect.collidepoint(mouse_pos) else self.color
         pygame.draw.rect(surface, color, self.rect)
         pygame.draw.rect(surface, (200, 200, 200), self.rect, 2)
-        text_surf = self.font.render(self.text, False, (255, 255, 255))
+        text_surf = self._text_surf
         surface.blit(text_surf,
                      (self.rect.centerx - text_surf.get_width() // 2, self.rect.centery - text_surf.get_height() // 2))
 
@@ -97,12 +140,101 @@ class Button:
         return self.rect.collidepoint(mouse_pos) and mouse_pressed[0]
 
 
+class HudText:
+    def __init__(self, font, color):
+        self.font = font
+        self.color = color
+        self._text = None
+        self._surf = None
+
+    def render(self, text):
+        if text != self._text:
+            self._text = text
+            self._surf = self.font.render(text, False, self.color)
+        return self._surf
+
+
+def blit_batch(surface, blit_seq):
+    if PYGAME_CE:
+        surface.fblits(blit_seq)
+    else:
+        surface.blits(blit_seq, doreturn=False)
+
+
+def create_tile_surface(color):
+    surf = pygame.Surface((TILE_SIZE, TILE_SIZE)).convert()
+    surf.fill(color)
+    pygame.draw.rect(surf, (0, 0, 0), surf.get_rect(), 1)
+    return surf
+
+
+def create_hole_surface():
+    surf = create_tile_surface(TILE_COLORS_ARR[DIRT])
+    rect = surf.get_rect()
+    pygame.draw.rect(surf, (15, 10, 10), rect.inflate(-16, -16))
+    pygame.draw.rect(surf, C_COUNTER, (2, 2, TILE_SIZE - 4, 4))
+    pygame.draw.rect(surf, C_COUNTER, (2, rect.bottom - 6, TILE_SIZE - 4, 4))
+    pygame.draw.rect(surf, C_COUNTER, (2, 2, 4, TILE_SIZE - 4))
+    pygame.draw.rect(surf, C_COUNTER, (rect.right - 6, 2, 4, TILE_SIZE - 4))
+    return surf
+
+
+def read_move(keys):
+    for key, dx, dy, facing in MOVE_KEYS:
+        if keys[key]:
+            return dx, dy, facing
+    return 0, 0, None
+
+
+def dist2(a, b):
+    dx, dy = a[0] - b[0], a[1] - b[1]
+    return dx * dx + dy * dy
+
+
+@lru_cache(maxsize=None)
 def create_light_mask(radius, intensity=255):
+    yy, xx = np.ogrid[-radius:radius, -radius:radius]
+    d2 = xx * xx + yy * yy
+    r2 = radius * radius
+    val = np.where(d2 < r2, intensity * (1 - d2 / r2), 0).astype(np.uint8)
     mask = pygame.Surface((radius * 2, radius * 2))
-    for r in range(radius, 0, -2):
-        val = int(intensity * (1 - (r / radius) ** 2))
-        pygame.draw.circle(mask, (val, val, val), (radius, radius), r)
-    return mask
+    pygame.surfarray.blit_array(mask, np.stack([val, val, val], axis=-1))
+    return mask.convert()
+
+
+def create_overworld_background(ow_tiles):
+    tile_surfs = {
+        OW_WALL: create_tile_surface(C_WALL), OW_COUNTER: create_tile_surface(C_COUNTER),
+        OW_ORPHEUS: create_tile_surface(C_ORPHEUS), OW_HOLE: create_hole_surface()
+    }
+    blit_seq = []
+    for code, tile_surf in tile_surfs.items():
+        xs, ys = np.nonzero(ow_tiles == code)
+        blit_seq.extend((tile_surf, (x * TILE_SIZE, y * TILE_SIZE)) for x, y in zip(xs.tolist(), ys.tolist()))
+
+    background = pygame.Surface((WIDTH, HEIGHT)).convert()
+    background.fill(C_FLOOR)
+    blit_batch(background, blit_seq)
+    return background
+
+
+def create_overworld_darkness(orpheus_pos, torch_pos):
+    layer = pygame.Surface((WIDTH, HEIGHT)).convert()
+    layer.fill((40, 40, 50))
+
+    mask_ambient_corner = create_light_mask(150, 100)
+    layer.blit(mask_ambient_corner, (-50, -50), None, pygame.BLEND_RGB_ADD)
+    layer.blit(mask_ambient_corner, (WIDTH - 100, -50), None, pygame.BLEND_RGB_ADD)
+    layer.blit(mask_ambient_corner, (-50, HEIGHT - 100), None, pygame.BLEND_RGB_ADD)
+    layer.blit(mask_ambient_corner, (WIDTH - 100, HEIGHT - 100), None, pygame.BLEND_RGB_ADD)
+
+    if orpheus_pos:
+        layer.blit(create_light_mask(100, 150), (orpheus_pos[0] * TILE_SIZE - 84, orpheus_pos[1] * TILE_SIZE - 84),
+                   None, pygame.BLEND_RGB_ADD)
+    if torch_pos:
+        layer.blit(create_light_mask(80, 200), (torch_pos[0] * TILE_SIZE - 64, torch_pos[1] * TILE_SIZE - 64),
+                   None, pygame.BLEND_RGB_ADD)
+    return layer
 
 
 # --- UNIFIED ENTITY CLASS ---
@@ -135,7 +267,7 @@ class GridMole:
         s['CRAWLING'].append(surf3)
         s['CRAWLING'].append(surf1)
 
-        return s
+        return {state: [surf.convert_alpha() for surf in frames] for state, frames in s.items()}
 
     def process_animation(self, dt):
         self.anim_timer += dt
@@ -153,104 +285,164 @@ class GridMole:
 
 
 # --- UNDERGROUND CLASSES ---
-class Particle:
-    __slots__ = ['active', 'x', 'y', 'vx', 'vy', 'color', 'life']
-
-    def __init__(self):
-        self.active = False
-        self.x = self.y = self.vx = self.vy = self.life = 0
-        self.color = (255, 255, 255)
-
-
 class ParticlePool:
     def __init__(self, size=256):
-        self.pool = [Particle() for _ in range(size)]
+        self.active = np.zeros(size, dtype=np.bool_)
+        self.x = np.zeros(size, dtype=np.float32)
+        self.y = np.zeros(size, dtype=np.float32)
+        self.vx = np.zeros(size, dtype=np.float32)
+        self.vy = np.zeros(size, dtype=np.float32)
+        self.color = np.full((size, 3), 255, dtype=np.uint8)
+        self.life = np.zeros(size, dtype=np.int16)
+        self._sprite_cache = {}
 
     def emit(self, x, y, color, count=8):
-        emitted = 0
-        for p in self.pool:
-            if not p.active:
-                p.active, p.x, p.y = True, x, y
-                p.vx, p.vy = random.uniform(-3, 3), random.uniform(-5, -1)
-                p.color, p.life = color, 255
-                emitted += 1
-                if emitted >= count: break
+        idx = np.flatnonzero(~self.active)[:count]
+        self.active[idx] = True
+        self.x[idx], self.y[idx] = x, y
+        self.vx[idx] = np.random.uniform(-3, 3, len(idx))
+        self.vy[idx] = np.random.uniform(-5, -1, len(idx))
+        self.color[idx] = color[:3]
+        self.life[idx] = 255
+
+    def _sprite(self, color, alpha):
+        key = (*color[:3], alpha)
+        surf = self._sprite_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((4, 4), pygame.SRCALPHA).convert_alpha()
+            surf.fill(key)
+            self._sprite_cache[key] = surf
+        return surf
 
     def update_and_draw(self, surface, camera_y):
-        for p in self.pool:
-            if p.active:
-                p.vy += 0.3
-                p.x += p.vx
-                p.y += p.vy
-                p.life -= 8
-                if p.life <= 0:
-                    p.active = False
-                else:
-                    surf = pygame.Surface((4, 4), pygame.SRCALPHA)
-                    surf.fill((*p.color[:3], max(0, int(p.life))))
-                    surface.blit(surf, (int(p.x), int(p.y) - camera_y))
+        idx = np.flatnonzero(self.active)
+        self.vy[idx] += 0.3
+        self.x[idx] += self.vx[idx]
+        self.y[idx] += self.vy[idx]
+        self.life[idx] -= 8
+        self.active[idx] = self.life[idx] > 0
+        idx = idx[self.active[idx]]
+
+        blit_seq = [(self._sprite(color, alpha), (x, y - camera_y)) for color, alpha, x, y in
+                    zip(self.color[idx].tolist(), (self.life[idx] & 0xF8).tolist(),
+                        self.x[idx].astype(np.int32).tolist(), self.y[idx].astype(np.int32).tolist())]
+        blit_batch(surface, blit_seq)
+
+
+@njit(cache=True)
+def _compute_weights(scaled_depth):
+    weights = np.array([71.0, 10.0, 8.0, 4.0, 1.0, 1.0])
+    if scaled_depth > 0:
+        weights[1] = max(5.0, _ROCK_B + scaled_depth * _ROCK_S)
+        weights[2] = max(1.0, _BRONZE_B + scaled_depth * _BRONZE_S)
+        weights[3] = max(1.0, _SILVER_B + scaled_depth * _SILVER_S)
+        weights[4] = _GOLD_B + scaled_depth * _GOLD_S
+        weights[5] = _DIAMOND_B + scaled_depth * _DIAMOND_S
+        weights[0] = max(10.0, 100.0 - weights[1:].sum())
+    return weights
+
+
+@njit(cache=True)
+def _fill_rows(tile_ids, hp, y_start, rnd):
+    for i in range(rnd.shape[0]):
+        y = y_start + i
+        if y < 10:
+            tile_ids[:, y] = DIRT
+            hp[:, y] = DURABILITY_LUT[DIRT]
+            continue
+        cum_weights = np.cumsum(_compute_weights(max(0, y - 20)))
+        idx = np.searchsorted(cum_weights, rnd[i] * cum_weights[-1], side='right')
+        row = TERRAIN_CHOICES[np.minimum(idx, len(TERRAIN_CHOICES) - 1)]
+        tile_ids[:, y] = row
+        hp[:, y] = DURABILITY_LUT[row]
 
 
 class Terrain:
+    GLOW_STEPS = 8
+    ROW_CHUNK = 64
+    GEN_CHUNK = 32
+
     def __init__(self):
-        self.grid = {}
+        self.tile_ids = np.full((COLS, self.ROW_CHUNK), DIRT, dtype=np.uint8)
+        self.hp = np.ones((COLS, self.ROW_CHUNK), dtype=np.uint16)
         self.highest_y_generated = -1
-
-    def generate_row(self, y_depth):
-        if (0, y_depth) in self.grid: return
-        if y_depth < 10:
-            for x in range(COLS): self.grid[(x, y_depth)] = [DIRT, DURABILITY[DIRT]]
-            return
-
-        choices = [DIRT, ROCK, BRONZE, SILVER, GOLD, DIAMOND]
-        weights = [71, 10, 8, 4, 1, 1]
-        scaled_depth = max(0, y_depth - 20)
-        if scaled_depth > 0:
-            weights[1] = max(5, ORE_CONFIG['ROCK']['base'] + scaled_depth * ORE_CONFIG['ROCK']['scale'])
-            weights[2] = max(1, ORE_CONFIG['BRONZE']['base'] + scaled_depth * ORE_CONFIG['BRONZE']['scale'])
-            weights[3] = max(1, ORE_CONFIG['SILVER']['base'] + scaled_depth * ORE_CONFIG['SILVER']['scale'])
-            weights[4] = ORE_CONFIG['GOLD']['base'] + scaled_depth * ORE_CONFIG['GOLD']['scale']
-            weights[5] = ORE_CONFIG['DIAMOND']['base'] + scaled_depth * ORE_CONFIG['DIAMOND']['scale']
-            weights[0] = max(10, 100 - sum(weights[1:]))
-
-        for x in range(COLS):
-            tile_id = random.choices(choices, weights=weights, k=1)[0]
-            self.grid[(x, y_depth)] = [tile_id, DURABILITY.get(tile_id, 1)]
+        self._tile_cache = tuple(create_tile_surface(color) for color in TILE_COLORS_ARR)
+        self._glow_lut = tuple([self._build_glow(tile_id, step) for step in range(self.GLOW_STEPS)]
+                               if color is not None else None
+                               for tile_id, color in enumerate(GLOW_BASE_COLORS_ARR))
+        self._hpbar_cache = {}
+
+    @classmethod
+    def _build_glow(cls, tile_id, step):
+        pulse = step / (cls.GLOW_STEPS - 1)
+        glow_radius = int((TILE_SIZE * 0.6) + (pulse * TILE_SIZE * 0.3))
+        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(glow_surf, (*GLOW_BASE_COLORS_ARR[tile_id], int(30 + (pulse * 50))),
+                           (glow_radius, glow_radius), glow_radius)
+        return glow_surf.convert_alpha()
+
+    def _hpbar(self, bar_width):
+        surf = self._hpbar_cache.get(bar_width)
+        if surf is None:
+            surf = pygame.Surface((TILE_SIZE - 4, 4)).convert()
+            surf.fill((255, 0, 0))
+            pygame.draw.rect(surf, (0, 255, 0), (0, 0, bar_width, 4))
+            self._hpbar_cache[bar_width] = surf
+        return surf
+
+    def _reserve_rows(self, rows):
+        capacity = self.tile_ids.shape[1]
+        if rows > capacity:
+            extra = -(-(rows - capacity) // self.ROW_CHUNK) * self.ROW_CHUNK
+            self.tile_ids = np.concatenate((self.tile_ids, np.full((COLS, extra), DIRT, dtype=np.uint8)), axis=1)
+            self.hp = np.concatenate((self.hp, np.ones((COLS, extra), dtype=np.uint16)), axis=1)
+
+    def generate_chunk(self, y_start, y_end):
+        self._reserve_rows(y_end)
+        _fill_rows(self.tile_ids, self.hp, y_start, np.random.random((y_end - y_start, COLS)))
 
     def ensure_generated(self, target_y):
-        if target_y > self.highest_y_generated:
-            for y in range(self.highest_y_generated + 1, target_y + 1):
-                self.generate_row(y)
-            self.highest_y_generated = target_y
+        while target_y > self.highest_y_generated:
+            y_start = self.highest_y_generated + 1
+            self.generate_chunk(y_start, y_start + self.GEN_CHUNK)
+            self.highest_y_generated = y_start + self.GEN_CHUNK - 1
 
     def draw(self, surface, camera_y, ticks):
         start_row = int(camera_y // TILE_SIZE)
         pulse = (math.sin(ticks * 0.005) + 1) / 2
-
-        for y in range(max(0, start_row), start_row + ROWS + 2):
-            for x in range(COLS):
-                tile_data = self.grid.get((x, y), [DIRT, 1])
-                tile_id, hp = tile_data[0], tile_data[1]
-                if tile_id != EMPTY:
-                    screen_x, screen_y = x * TILE_SIZE, (y * TILE_SIZE) - camera_y
-                    rect = pygame.Rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE)
-
-                    if tile_id in GLOW_BASE_COLORS:
-                        glow_radius = int((TILE_SIZE * 0.6) + (pulse * TILE_SIZE * 0.3))
-                        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                        pygame.draw.circle(glow_surf, (*GLOW_BASE_COLORS[tile_id], int(30 + (pulse * 50))),
-                                           (glow_radius, glow_radius), glow_radius)
-                        surface.blit(glow_surf, (rect.centerx - glow_radius, rect.centery - glow_radius))
-
-                    pygame.draw.rect(surface, TILE_COLORS[tile_id], rect)
-                    pygame.draw.rect(surface, (0, 0, 0, 50), rect, 1)
-
-                    max_hp = DURABILITY.get(tile_id, 1)
-                    if tile_id != ROCK and hp < max_hp:
-                        bar_width = int((TILE_SIZE - 4) * (hp / max_hp))
-                        bar_y = screen_y + TILE_SIZE - 6
-                        pygame.draw.rect(surface, (255, 0, 0), (screen_x + 2, bar_y, TILE_SIZE - 4, 4))
-                        pygame.draw.rect(surface, (0, 255, 0), (screen_x + 2, bar_y, bar_width, 4))
+        glow_step = min(int(pulse * self.GLOW_STEPS), self.GLOW_STEPS - 1)
+        glow_seq, tile_seq, hpbar_seq = [], [], []
+
+        first_row = max(0, start_row)
+        last_row = min(start_row + ROWS + 2, self.tile_ids.shape[1])
+        visible = self.tile_ids[:, first_row:last_row]
+        xs, ys = np.nonzero(visible != EMPTY)
+        ids, hps = visible[xs, ys], self.hp[xs, ys + first_row]
+        screen_xs = xs * TILE_SIZE
+        screen_ys = (ys + first_row) * TILE_SIZE - int(camera_y)
+
+        for tile_id in np.unique(ids).tolist():
+            is_tile = ids == tile_id
+            tile_xs, tile_ys = screen_xs[is_tile].tolist(), screen_ys[is_tile].tolist()
+            tile_surf = self._tile_cache[tile_id]
+            tile_seq.extend((tile_surf, pos) for pos in zip(tile_xs, tile_ys))
+
+            if GLOW_BASE_COLORS_ARR[tile_id] is not None:
+                glow_surf = self._glow_lut[tile_id][glow_step]
+                off_x = (TILE_SIZE - glow_surf.get_width()) // 2
+                off_y = (TILE_SIZE - glow_surf.get_height()) // 2
+                glow_seq.extend((glow_surf, (sx + off_x, sy + off_y)) for sx, sy in zip(tile_xs, tile_ys))
+
+        max_hps = DURABILITY_LUT[ids]
+        damaged = (ids != ROCK) & (hps < max_hps)
+        for sx, sy, hp, max_hp in zip(screen_xs[damaged].tolist(), screen_ys[damaged].tolist(),
+                                      hps[damaged].tolist(), max_hps[damaged].tolist()):
+            bar_width = int((TILE_SIZE - 4) * (hp / max_hp))
+            hpbar_seq.append((self._hpbar(bar_width), (sx + 2, sy + TILE_SIZE - 6)))
+
+        blit_batch(surface, glow_seq)
+        blit_batch(surface, tile_seq)
+        blit_batch(surface, hpbar_seq)
 
 
 # --- MAIN ENGINE ---
@@ -272,7 +464,7 @@ def main():
     overworld_substate = 'WALK'
     show_inventory = False
 
-    ow_grid = {}
+    ow_tiles = np.zeros((len(LEVEL_MAP[0]), len(LEVEL_MAP)), dtype=np.uint8)
     orpheus_pos = None
     hole_pos = None
     torch_pos = None
@@ -280,17 +472,21 @@ def main():
 
     for r_idx, row in enumerate(LEVEL_MAP):
         for c_idx, char in enumerate(row):
-            ow_grid[(c_idx, r_idx)] = char
+            ow_tiles[c_idx, r_idx] = OW_TILE_CODES[char]
             if char == 'O':
                 orpheus_pos = (c_idx, r_idx)
             elif char == 'H':
                 hole_pos = (c_idx, r_idx)
             elif char == 't':
-                torch_pos = (c_idx, r_idx); ow_grid[(c_idx, r_idx)] = '.'
+                torch_pos = (c_idx, r_idx)
             elif char == 'S':
-                spawn_pos = (c_idx, r_idx); ow_grid[(c_idx, r_idx)] = '.'
+                spawn_pos = (c_idx, r_idx)
 
     ow_mole = GridMole(spawn_pos[0], spawn_pos[1])
+    d_npc = dist2(spawn_pos, orpheus_pos)
+    d_hole = dist2(spawn_pos, hole_pos)
+    d_torch = dist2(spawn_pos, torch_pos) if torch_pos else 999
+    ow_background = create_overworld_background(ow_tiles)
 
     action_panel_rect = pygame.Rect(0, HEIGHT - UI_PANEL_HEIGHT, WIDTH, UI_PANEL_HEIGHT)
 
@@ -307,17 +503,26 @@ def main():
     btn_sell_all = Button(WIDTH // 4 - 75, HEIGHT // 2, 150, 40, "Sell All Ores", font_small)
     btn_buy_shovel = Button(WIDTH * 3 // 4 - 75, HEIGHT // 2, 150, 40, "Upgrade Shovel ($100)", font_small)
 
-    mask_ambient_corner = create_light_mask(150, 100)
-    mask_orpheus = create_light_mask(100, 150)
+    hud_money = HudText(font_small, (255, 255, 255))
+    hud_depth = HudText(font_small, (255, 255, 255))
+    hud_funds = HudText(font_large, (0, 255, 0))
+    hud_ore_counts = {ore_id: HudText(font_small, GLOW_BASE_COLORS[ore_id]) for ore_id in session.inventory}
+    text_greeting = font_large.render("Orpheus: Greetings, delver.", False, (255, 255, 255))
+    text_shop_title = font_large.render("ORPHEUS' EMPORIUM", False, C_ORPHEUS)
+    text_inv_title = font_large.render("INVENTORY", False, (255, 255, 255))
+
     mask_torch_large = create_light_mask(250, 255)
     mask_torch_small = create_light_mask(80, 200)
+    darkness_layer = pygame.Surface((WIDTH, HEIGHT)).convert()
+    ow_static_dark = create_overworld_darkness(orpheus_pos, torch_pos)
 
     terrain = Terrain()
     ug_mole = GridMole(COLS // 2, 5)
     particle_pool = ParticlePool()
     camera_y = 0.0
     terrain.ensure_generated(ROWS + 5)
-    terrain.grid[(ug_mole.grid_x, ug_mole.grid_y)] = [EMPTY, 0]
+    terrain.tile_ids[ug_mole.grid_x, ug_mole.grid_y] = EMPTY
+    terrain.hp[ug_mole.grid_x, ug_mole.grid_y] = 0
 
     mouse_was_pressed = False
 
@@ -356,19 +561,13 @@ def main():
                     ow_mole.can_move_timer -= dt
                     dx, dy = 0, 0
                     if ow_mole.can_move_timer <= 0:
-                        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                            dx, ow_mole.facing_right = -1, False
-                        elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                            dx, ow_mole.facing_right = 1, True
-                        elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                            dy = 1
-                        elif keys[pygame.K_UP] or keys[pygame.K_w]:
-                            dy = -1
+                        dx, dy, facing = read_move(keys)
+                        if facing is not None: ow_mole.facing_right = facing
 
                     if dx != 0 or dy != 0:
                         tx, ty = ow_mole.grid_x + dx, ow_mole.grid_y + dy
-                        target_tile = ow_grid.get((tx, ty), 'W')
-                        if target_tile in ['.', 'S']:
+                        in_bounds = 0 <= tx < ow_tiles.shape[0] and 0 <= ty < ow_tiles.shape[1]
+                        if in_bounds and ow_tiles[tx, ty] == OW_FLOOR:
                             ow_mole.grid_x, ow_mole.grid_y = tx, ty
                             ow_mole.can_move_timer = 150
                             ow_mole.state = 'CRAWLING' if dy < 0 or dx != 0 else 'IDLE'
@@ -379,21 +578,21 @@ def main():
 
                     ow_mole.process_animation(dt)
 
-                    dist_to_npc = math.hypot(ow_mole.grid_x - orpheus_pos[0], ow_mole.grid_y - orpheus_pos[1])
-                    dist_to_hole = math.hypot(ow_mole.grid_x - hole_pos[0], ow_mole.grid_y - hole_pos[1])
-                    dist_to_torch = math.hypot(ow_mole.grid_x - torch_pos[0],
-                                               ow_mole.grid_y - torch_pos[1]) if torch_pos else 99
+                    mole_pos = (ow_mole.grid_x, ow_mole.grid_y)
+                    d_npc, d_hole = dist2(mole_pos, orpheus_pos), dist2(mole_pos, hole_pos)
+                    d_torch = dist2(mole_pos, torch_pos) if torch_pos else 999
 
-                    if dist_to_npc < 2.0 and mouse_clicked and btn_talk.is_clicked(mouse_pos, mouse_pressed):
+                    if d_npc < 4 and mouse_clicked and btn_talk.is_clicked(mouse_pos, mouse_pressed):
                         audio.play('talk')
                         overworld_substate = 'DIALOGUE'
-                    elif dist_to_hole < 2.0 and mouse_clicked and btn_mine.is_clicked(mouse_pos, mouse_pressed):
+                    elif d_hole < 4 and mouse_clicked and btn_mine.is_clicked(mouse_pos, mouse_pressed):
                         global_state = 'UNDERGROUND'
                         ug_mole.can_move_timer = 300
-                    elif dist_to_torch < 2.0 and not session.has_torch and mouse_clicked and btn_torch.is_clicked(
+                    elif d_torch < 4 and not session.has_torch and mouse_clicked and btn_torch.is_clicked(
                             mouse_pos, mouse_pressed):
                         session.has_torch = True
                         torch_pos = None
+                        ow_static_dark = create_overworld_darkness(orpheus_pos, torch_pos)
 
                 elif overworld_substate == 'DIALOGUE':
                     if mouse_clicked and btn_open_shop.is_clicked(mouse_pos, mouse_pressed):
@@ -420,31 +619,25 @@ def main():
                 ug_mole.can_move_timer -= dt
                 dx, dy = 0, 0
                 if ug_mole.can_move_timer <= 0:
-                    if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                        dx, ug_mole.facing_right = -1, False
-                    elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                        dx, ug_mole.facing_right = 1, True
-                    elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                        dy = 1
-                    elif keys[pygame.K_UP] or keys[pygame.K_w]:
-                        dy = -1
+                    dx, dy, facing = read_move(keys)
+                    if facing is not None: ug_mole.facing_right = facing
 
                 if dx != 0 or dy != 0:
                     tx, ty = ug_mole.grid_x + dx, ug_mole.grid_y + dy
                     if 0 <= tx < COLS and ty >= 0:
-                        tile_data = terrain.grid.get((tx, ty), [DIRT, 1])
-                        if tile_data[0] == EMPTY:
+                        tile_id = int(terrain.tile_ids[tx, ty])
+                        if tile_id == EMPTY:
                             ug_mole.grid_x, ug_mole.grid_y = tx, ty
                             ug_mole.can_move_timer = 150
                             ug_mole.state = 'CRAWLING' if dy < 0 or dx != 0 else 'IDLE'
-                        elif tile_data[0] != ROCK:
+                        elif tile_id != ROCK:
                             audio.play('dig')
-                            terrain.grid[(tx, ty)][1] -= 1
-                            if terrain.grid[(tx, ty)][1] <= 0:
-                                if tile_data[0] in session.inventory: session.inventory[tile_data[0]] += 1
+                            terrain.hp[tx, ty] -= 1
+                            if terrain.hp[tx, ty] <= 0:
+                                if tile_id in session.inventory: session.inventory[tile_id] += 1
                                 particle_pool.emit((tx * TILE_SIZE) + 16, (ty * TILE_SIZE) + 16,
-                                                   TILE_COLORS[tile_data[0]])
-                                terrain.grid[(tx, ty)][0] = EMPTY
+                                                   TILE_COLORS_ARR[tile_id])
+                                terrain.tile_ids[tx, ty] = EMPTY
                                 ug_mole.grid_x, ug_mole.grid_y = tx, ty
                                 ug_mole.can_move_timer = 150
                                 ug_mole.state = 'CRAWLING' if dy < 0 or dx != 0 else 'IDLE'
@@ -468,28 +661,7 @@ def main():
 
                     # --- RENDERING PIPELINE ---
         if global_state == 'OVERWORLD':
-            screen.fill(C_FLOOR)
-            for r in range(ROWS):
-                for c in range(COLS):
-                    char = ow_grid.get((c, r), '.')
-                    rect = pygame.Rect(c * TILE_SIZE, r * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                    if char == 'W':
-                        pygame.draw.rect(screen, C_WALL, rect)
-                        pygame.draw.rect(screen, (0, 0, 0), rect, 1)
-                    elif char == 'C':
-                        pygame.draw.rect(screen, C_COUNTER, rect)
-                        pygame.draw.rect(screen, (0, 0, 0), rect, 1)
-                    elif char == 'O':
-                        pygame.draw.rect(screen, C_ORPHEUS, rect)
-                        pygame.draw.rect(screen, (0, 0, 0), rect, 1)
-                    elif char == 'H':
-                        pygame.draw.rect(screen, TILE_COLORS[DIRT], rect)
-                        pygame.draw.rect(screen, (0, 0, 0), rect, 1)
-                        pygame.draw.rect(screen, (15, 10, 10), rect.inflate(-16, -16))
-                        pygame.draw.rect(screen, C_COUNTER, (rect.x + 2, rect.y + 2, TILE_SIZE - 4, 4))
-                        pygame.draw.rect(screen, C_COUNTER, (rect.x + 2, rect.bottom - 6, TILE_SIZE - 4, 4))
-                        pygame.draw.rect(screen, C_COUNTER, (rect.x + 2, rect.y + 2, 4, TILE_SIZE - 4))
-                        pygame.draw.rect(screen, C_COUNTER, (rect.right - 6, rect.y + 2, 4, TILE_SIZE - 4))
+            screen.blit(ow_background, (0, 0))
 
             if torch_pos:
                 pygame.draw.rect(screen, (139, 69, 19),
@@ -499,20 +671,7 @@ def main():
 
             ow_mole.draw(screen)
 
-            darkness_layer = pygame.Surface((WIDTH, HEIGHT))
-            darkness_layer.fill((40, 40, 50))
-
-            darkness_layer.blit(mask_ambient_corner, (-50, -50), None, pygame.BLEND_RGB_ADD)
-            darkness_layer.blit(mask_ambient_corner, (WIDTH - 100, -50), None, pygame.BLEND_RGB_ADD)
-            darkness_layer.blit(mask_ambient_corner, (-50, HEIGHT - 100), None, pygame.BLEND_RGB_ADD)
-            darkness_layer.blit(mask_ambient_corner, (WIDTH - 100, HEIGHT - 100), None, pygame.BLEND_RGB_ADD)
-
-            if orpheus_pos:
-                darkness_layer.blit(mask_orpheus, (orpheus_pos[0] * TILE_SIZE - 84, orpheus_pos[1] * TILE_SIZE - 84),
-                                    None, pygame.BLEND_RGB_ADD)
-            if torch_pos:
-                darkness_layer.blit(mask_torch_small, (torch_pos[0] * TILE_SIZE - 64, torch_pos[1] * TILE_SIZE - 64),
-                                    None, pygame.BLEND_RGB_ADD)
+            darkness_layer.blit(ow_static_dark, (0, 0))
 
             px, py = ow_mole.grid_x * TILE_SIZE + 16, ow_mole.grid_y * TILE_SIZE + 16
             if session.has_torch:
@@ -526,18 +685,12 @@ def main():
                 pygame.draw.rect(screen, (20, 20, 25), action_panel_rect)
                 pygame.draw.rect(screen, (100, 100, 100), action_panel_rect, 2)
 
-                screen.blit(font_small.render(f"Money: ${session.money} | Shovel Lv: {session.shovel_level}", False,
-                                              (255, 255, 255)), (120, 15))
+                screen.blit(hud_money.render(f"Money: ${session.money} | Shovel Lv: {session.shovel_level}"), (120, 15))
                 btn_inv_toggle.draw(screen, mouse_pos)
 
-                dist_to_npc = math.hypot(ow_mole.grid_x - orpheus_pos[0], ow_mole.grid_y - orpheus_pos[1])
-                dist_to_hole = math.hypot(ow_mole.grid_x - hole_pos[0], ow_mole.grid_y - hole_pos[1])
-                dist_to_torch = math.hypot(ow_mole.grid_x - torch_pos[0],
-                                           ow_mole.grid_y - torch_pos[1]) if torch_pos else 99
-
-                if dist_to_npc < 2.0: btn_talk.draw(screen, mouse_pos)
-                if dist_to_hole < 2.0: btn_mine.draw(screen, mouse_pos)
-                if dist_to_torch < 2.0 and not session.has_torch: btn_torch.draw(screen, mouse_pos)
+                if d_npc < 4: btn_talk.draw(screen, mouse_pos)
+                if d_hole < 4: btn_mine.draw(screen, mouse_pos)
+                if d_torch < 4 and not session.has_torch: btn_torch.draw(screen, mouse_pos)
 
             elif overworld_substate == 'DIALOGUE':
                 overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
@@ -546,32 +699,29 @@ def main():
                 dialogue_rect = pygame.Rect(50, HEIGHT - 150, WIDTH - 100, 100)
                 pygame.draw.rect(screen, (20, 20, 30), dialogue_rect)
                 pygame.draw.rect(screen, (200, 200, 200), dialogue_rect, 2)
-                screen.blit(font_large.render("Orpheus: Greetings, delver.", False, (255, 255, 255)),
-                            (dialogue_rect.x + 20, dialogue_rect.y + 20))
+                screen.blit(text_greeting, (dialogue_rect.x + 20, dialogue_rect.y + 20))
                 btn_open_shop.draw(screen, mouse_pos)
 
             elif overworld_substate == 'SHOP':
                 screen.fill((30, 30, 40))
-                screen.blit(font_large.render("ORPHEUS' EMPORIUM", False, C_ORPHEUS), (WIDTH // 2 - 120, 40))
+                screen.blit(text_shop_title, (WIDTH // 2 - 120, 40))
                 labels = {BRONZE: "Bronze", SILVER: "Silver", GOLD: "Gold", DIAMOND: "Diamond"}
                 y_off = 120
                 for ore_id in [BRONZE, SILVER, GOLD, DIAMOND]:
-                    screen.blit(font_small.render(f"{labels[ore_id]}: {session.inventory[ore_id]}", False,
-                                                  GLOW_BASE_COLORS[ore_id]), (WIDTH // 4 - 50, y_off))
+                    screen.blit(hud_ore_counts[ore_id].render(f"{labels[ore_id]}: {session.inventory[ore_id]}"),
+                                (WIDTH // 4 - 50, y_off))
                     y_off += 30
-                screen.blit(font_large.render(f"Current Funds: ${session.money}", False, (0, 255, 0)),
-                            (WIDTH // 2 - 100, HEIGHT - 80))
+                screen.blit(hud_funds.render(f"Current Funds: ${session.money}"), (WIDTH // 2 - 100, HEIGHT - 80))
                 btn_sell_all.draw(screen, mouse_pos)
                 btn_buy_shovel.draw(screen, mouse_pos)
                 btn_close_shop.draw(screen, mouse_pos)
 
         elif global_state == 'UNDERGROUND':
-            screen.fill(TILE_COLORS[EMPTY])
+            screen.fill(TILE_COLORS_ARR[EMPTY])
             terrain.draw(screen, camera_y, ticks)
             ug_mole.draw(screen, camera_y)
             particle_pool.update_and_draw(screen, camera_y)
 
-            darkness_layer = pygame.Surface((WIDTH, HEIGHT))
             darkness_layer.fill((10, 10, 15))
 
             px, py = ug_mole.grid_x * TILE_SIZE + 16, (ug_mole.grid_y * TILE_SIZE) - int(camera_y) + 16
@@ -583,7 +733,7 @@ def main():
 
             screen.blit(darkness_layer, (0, 0), None, pygame.BLEND_RGB_MULT)
 
-            screen.blit(font_small.render(f"Depth: {ug_mole.grid_y}m", False, (255, 255, 255)), (120, 15))
+            screen.blit(hud_depth.render(f"Depth: {ug_mole.grid_y}m"), (120, 15))
             btn_inv_toggle.draw(screen, mouse_pos)
             btn_surface.draw(screen, mouse_pos)
 
@@ -596,14 +746,12 @@ def main():
             pygame.draw.rect(screen, (50, 40, 30), panel_rect)
             pygame.draw.rect(screen, (200, 180, 150), panel_rect, 3)
 
-            title = font_large.render("INVENTORY", False, (255, 255, 255))
-            screen.blit(title, (panel_rect.centerx - title.get_width() // 2, panel_rect.y + 20))
+            screen.blit(text_inv_title, (panel_rect.centerx - text_inv_title.get_width() // 2, panel_rect.y + 20))
 
             y_offset = panel_rect.y + 80
             labels = {BRONZE: "Bronze", SILVER: "Silver", GOLD: "Gold", DIAMOND: "Diamond"}
             for ore_id in [BRONZE, SILVER, GOLD, DIAMOND]:
-                text = font_small.render(f"{labels[ore_id]}: {session.inventory[ore_id]}", False,
-                                         GLOW_BASE_COLORS[ore_id])
+                text = hud_ore_counts[ore_id].render(f"{labels[ore_id]}: {session.inventory[ore_id]}")
                 screen.blit(text, (panel_rect.x + 40, y_offset))
                 y_offset += 40
 